@@ -3,6 +3,7 @@ from genedesign.seq_utils.reverse_complement import reverse_complement
 class ForbiddenSequenceChecker:
     def __init__(self):
         self.forbidden = []
+        self.forbidden_pairs = []
 
     def initiate(self):
         # Populate forbidden sequences
@@ -27,13 +28,15 @@ class ForbiddenSequenceChecker:
             "AAGCTT",    # HindIII
         ]
 
+        # Pair each site with its reverse complement so run() only scans the given strand
+        self.forbidden_pairs = [(site, reverse_complement(site)) for site in self.forbidden]
+
     def run(self, dnaseq):
-        # Use the reverse_complement function from seq_utils
-        rc = reverse_complement(dnaseq)
-        combined = (dnaseq + "x" + rc).upper()
+        # A site on the reverse strand shows up as its reverse complement on this strand
+        seq = dnaseq.upper()
 
-        for site in self.forbidden:
-            if site in combined:
+        for site, site_rc in self.forbidden_pairs:
+            if site in seq or site_rc in seq:
                 return False, site
 
         return True, None
@@ -1,8 +1,12 @@
-import re 
 from genedesign.models.transcript import Transcript
 from genedesign.models.rbs_option import RBSOption
 from genedesign.models.operon import Operon
 
+_SHINE_DALGARNO = "AUUAUU"
+_START_CODON = "AUG"
+_SPACER_LENGTHS = (9, 8, 7)
+_SPACER_BASES = frozenset("AUCG")
+
 class InternalRBSChecker:
     """
     Description: This class checks sequences for internal RBS binding sites
@@ -21,22 +25,53 @@ class InternalRBSChecker:
 
     def __init__(self) -> None:
         """
-        Defines the regex pattern used to check the input for a Shine-Dalgarno 
+        Defines the anchors used to check the input for a Shine-Dalgarno 
         sequence and a start codon.
         """
 
-        self.rbs_pattern = None
+        self.shine_dalgarno = None
+        self.start_codon = None
+        self.spacer_lengths = None
+        self.spacer_bases = None
 
     def initiate(self) -> None:
         """
-        Defines the regex pattern used to check the input sequence.
+        Binds the module-level Shine-Dalgarno and start codon anchors used to check
+        the input sequence, along with the allowed spacer lengths between them
+        (longest first).
         """
         
-        self.rbs_pattern = re.compile(r"AUUAUU[AUCG]{7,9}AUG")
+        self.shine_dalgarno = _SHINE_DALGARNO
+        self.start_codon = _START_CODON
+        self.spacer_lengths = _SPACER_LENGTHS
+        self.spacer_bases = _SPACER_BASES
+
+    def _match_end(self, seq, spacer_start):
+        """
+        Looks for a start codon 7-9 bases after a Shine-Dalgarno sequence, preferring
+        the longest spacer.
+
+        Parameters:
+            seq (str): An operon RNA sequence
+            spacer_start (int): Index directly after the Shine-Dalgarno sequence
+
+        Returns:
+            int or None: Index directly after the start codon, or None if there is no match.
+        """
+
+        for spacer_length in self.spacer_lengths:
+            codon_start = spacer_start + spacer_length
+            if seq.startswith(self.start_codon, codon_start) and \
+                    self.spacer_bases.issuperset(seq[spacer_start:codon_start]):
+                return codon_start + len(self.start_codon)
+
+        return None
 
     def run(self, seq):
         """
-        Checks the input sequence for an RBS based on the pattern.
+        Checks the input sequence for an RBS based on the pattern. Shine-Dalgarno
+        anchors are located with str.find and each one is paired with a start codon
+        at the allowed spacer offsets, so the sequence is scanned in a single pass.
 
         Parameters:
             seq (str): An operon DNA sequence
@@ -49,11 +84,19 @@ class InternalRBSChecker:
             As defined in the class definition. 
         """
 
-        seq.replace('T', 'U')
+        seq = seq.replace('T', 'U')
 
-        matches = list(self.rbs_pattern.finditer(seq))
+        positions = []
+        sd_length = len(self.shine_dalgarno)
 
-        positions = [match.start() for match in matches]
+        start = seq.find(self.shine_dalgarno)
+        while start >= 0:
+            end = self._match_end(seq, start + sd_length)
+            if end is None:
+                start = seq.find(self.shine_dalgarno, start + 1)
+            else:
+                positions.append(start)
+                start = seq.find(self.shine_dalgarno, end)
 
         num_sites = len(positions)
 
@@ -103,7 +146,7 @@ if __name__ == "__main__":
         terminator="TGA"
     )
 
-    operon_seq = operon.promoter + "".join([transcript.rbs.utr + transcript.rbs.cds for transcript in operon.transcripts]) + operon.terminator
+    operon_seq = operon.promoter + operon.assembled + operon.terminator
 
     internal_rbs, num_sites, positions = internal_rbs_checker.run(operon_seq)
 
@@ -1,8 +1,78 @@
-import re
+from itertools import product
+import numpy as np
 from genedesign.models.transcript import Transcript
 from genedesign.models.rbs_option import RBSOption
 from genedesign.models.operon import Operon
 
+_T_TO_U = bytes.maketrans(b'T', b'U')
+
+# The bases allowed at each position of an RNase E site; variants are added here
+# without adding passes over the sequence
+_RNASE_E_MOTIF = ("AU", "A", "U", "U", "AU")
+_RNASE_E_SITES = tuple("".join(site).encode('ascii') for site in product(*_RNASE_E_MOTIF))
+
+# Below this length NumPy's per-call overhead outweighs its vectorized scan
+_SHORT_SEQ_LENGTH = 256
+
+def _find_sites(rna):
+    """
+    Finds every RNase E site in short RNA bytes by repeatedly calling bytes.find
+    for each literal variant of the motif.
+
+    Parameters:
+        rna (bytes): Encoded RNA.
+
+    Returns:
+        List[int]: Sorted start indices of all sites, including overlapping ones.
+    """
+
+    positions = []
+    for site in _RNASE_E_SITES:
+        i = rna.find(site)
+        while i >= 0:
+            positions.append(i)
+            i = rna.find(site, i + 1)
+
+    positions.sort()
+    return positions
+
+def _to_rna_bytes(seq):
+    """
+    Converts a sequence given as str or bytes into RNA bytes. Bytes input is
+    only translated, never re-encoded.
+    """
+
+    if isinstance(seq, str):
+        seq = seq.encode('ascii')
+    return seq.translate(_T_TO_U)
+
+def _site_hits(arr):
+    """
+    Marks where an RNase E site starts along the last axis of a uint8 array.
+
+    Parameters:
+        arr (np.ndarray): Encoded RNA, at least as long as the motif along its last axis.
+
+    Returns:
+        np.ndarray: Boolean array, shorter than arr by len(_RNASE_E_MOTIF) - 1 along its last axis.
+    """
+
+    width = arr.shape[-1] - len(_RNASE_E_MOTIF) + 1
+    allowed_masks = {}
+    hits = None
+
+    for offset, bases in enumerate(_RNASE_E_MOTIF):
+        if bases not in allowed_masks:
+            mask = arr == ord(bases[0])
+            for base in bases[1:]:
+                mask |= arr == ord(base)
+            allowed_masks[bases] = mask
+
+        window = allowed_masks[bases][..., offset:offset + width]
+        hits = window.copy() if hits is None else hits & window
+
+    return hits
+
 class RNaseEChecker:
     """
     Description: 
@@ -10,7 +80,7 @@ class RNaseEChecker:
     (A/G)AUU(A/U)
     
     Input (run method):
-        seq (str): An operon DNA sequence
+        seq (str or bytes): An operon DNA sequence
 
     Output:
         Tuple[bool, int, List[int]]: A tuple containing:
@@ -20,21 +90,22 @@ class RNaseEChecker:
     """
 
     def __init__(self) -> None:
-        self.pattern = None
+        pass
 
     def initiate(self) -> None:
         """
-        Defines the regex pattern used to check the input sequence.
+        The byte scan needs no setup; kept so RNaseEChecker matches the other checkers.
         """
 
-        self.pattern = re.compile(r"[AU]AUU[AU]")
-
     def run(self, seq):
         """
         Checks the input sequence for cleavage sites based on the RNase E pattern.
+        Short sequences are searched with bytes.find; longer ones are viewed as a NumPy
+        byte array and each position of the motif is compared in one vectorized pass.
+        Either way, overlapping sites are all reported.
 
         Parameters:
-            seq (str): An operon DNA sequence.
+            seq (str or bytes): An operon DNA sequence.
         
         Returns: 
             Tuple containing:
@@ -44,11 +115,12 @@ class RNaseEChecker:
             As defined in the class definition. 
         """
 
-        seq.replace('T', 'U')
-
-        matches = list(self.pattern.finditer(seq))
+        rna = _to_rna_bytes(seq)
 
-        positions = [match.start() for match in matches]
+        if len(rna) < _SHORT_SEQ_LENGTH:
+            positions = _find_sites(rna)
+        else:
+            positions = np.flatnonzero(_site_hits(np.frombuffer(rna, dtype=np.uint8))).tolist()
 
         num_sites = len(positions)
 
@@ -58,6 +130,59 @@ class RNaseEChecker:
             rnase_e_site_present = True
 
         return rnase_e_site_present, num_sites, positions
+
+    def run_many(self, seqs):
+        """
+        Checks several sequences for cleavage sites with a single vectorized scan. The
+        sequences are packed into one zero-padded 2D uint8 array, so the motif is
+        compared across every row at once instead of dispatching one scan per sequence.
+
+        Parameters:
+            seqs (List[str or bytes]): Operon DNA sequences.
+
+        Returns:
+            List[Tuple[bool, int, List[int]]]: One tuple per sequence, as returned by run.
+        """
+
+        rnas = [_to_rna_bytes(seq) for seq in seqs]
+        width = max((len(rna) for rna in rnas), default=0)
+
+        if width < len(_RNASE_E_MOTIF):
+            return [(True, 0, []) for _ in rnas]
+
+        # Zero padding never matches a base, so no site can span into it
+        packed = b"".join(rna.ljust(width, b"\0") for rna in rnas)
+        arr = np.frombuffer(packed, dtype=np.uint8).reshape(len(rnas), width)
+
+        rows, cols = np.nonzero(_site_hits(arr))
+        bounds = np.searchsorted(rows, np.arange(len(rnas) + 1)).tolist()
+        cols = cols.tolist()
+
+        results = []
+        for start, end in zip(bounds, bounds[1:]):
+            positions = cols[start:end]
+            results.append((len(positions) == 0, len(positions), positions))
+
+        return results
+
+    def passes(self, seq):
+        """
+        Fast path for callers that only need the boolean result of run. The input is
+        converted to RNA bytes and each literal variant of the RNase E pattern is
+        searched with bytes' C-level substring search, stopping at the first site found
+        instead of locating every site.
+
+        Parameters:
+            seq (str or bytes): An operon DNA sequence.
+
+        Returns:
+            bool: True if no RNase E cleavage site is present, the same as
+            rnase_e_site_present from run.
+        """
+
+        rna = _to_rna_bytes(seq)
+
+        return not any(site in rna for site in _RNASE_E_SITES)
     
 if __name__ == "__main__":
     """
@@ -99,7 +224,7 @@ if __name__ == "__main__":
         terminator="TGA"
     )
 
-    operon_seq = operon.promoter + "".join([transcript.rbs.utr + transcript.rbs.cds for transcript in operon.transcripts]) + operon.terminator
+    operon_seq = operon.promoter + operon.assembled + operon.terminator
 
     site_in_operon, num_operon_sites, operon_site_pos = rnase_e_checker.run(operon_seq)
 
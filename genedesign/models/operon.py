@@ -1,4 +1,6 @@
 from dataclasses import dataclass
+from functools import cached_property
+from itertools import chain
 from typing import List
 from .transcript import Transcript  # Assuming Transcript is defined in transcript.py
 
@@ -11,3 +13,11 @@ class Operon:
     transcripts: List[Transcript]
     promoter: str
     terminator: str
+
+    @cached_property
+    def assembled(self) -> str:
+        """
+        The RBS UTR and CDS of every transcript joined in order, built once and
+        reused by each checker run over the operon.
+        """
+        return "".join(chain.from_iterable((t.rbs.utr, t.rbs.cds) for t in self.transcripts))
\ No newline at end of file
@@ -1,12 +1,18 @@
 from genedesign.models.rbs_option import RBSOption
 from Bio import SeqIO
 from collections import defaultdict
+import heapq
+import os
+import pickle
 from genedesign.seq_utils.Translate import Translate
 from genedesign.seq_utils.reverse_complement import reverse_complement
 from genedesign.seq_utils.exclude_ignored import exclude_ignored
 from genedesign.seq_utils.check_secondary_structure import check_secondary_structure
 from genedesign.seq_utils.compare_peptides import compare_peptides
 
+# Bump whenever extract_genes_info changes its output so existing caches are rebuilt
+GENE_CACHE_VERSION = 1
+
 class RBSChooser:
     """
     A simple RBS selection algorithm that chooses an RBS from a list of options, excluding any RBS in the ignore set.
@@ -14,6 +20,7 @@ class RBSChooser:
 
     def __init__(self):
         self.rbs_options = []
+        self.rbs_option_index = {}
         self.translator = Translate()
         self.translator.initiate()
         self.gene_data = None
@@ -34,16 +41,20 @@ class RBSChooser:
 
         gene_dict = defaultdict(dict)
         for record in SeqIO.parse(genbank_file, "genbank"):
+            # Index each locus tag's first CDS once instead of rescanning all features per gene
+            cds_by_locus = {}
+            for cds in record.features:
+                if cds.type == "CDS":
+                    cds_locus_tags = cds.qualifiers.get("locus_tag")
+                    if cds_locus_tags and len(cds_locus_tags) == 1:
+                        cds_by_locus.setdefault(cds_locus_tags[0], cds)
+
             for feature in record.features:
                 if feature.type == "gene":
                     locus_tag = feature.qualifiers.get("locus_tag", [None])[0]
                     gene_name = feature.qualifiers.get("gene", [None])[0]
 
-                    cds_feature = None
-                    for cds in record.features:
-                        if cds.type == "CDS" and cds.qualifiers.get("locus_tag") == [locus_tag]:
-                            cds_feature = cds
-                            break
+                    cds_feature = cds_by_locus.get(locus_tag)
 
                     if cds_feature:
                         start, end = cds_feature.location.start, cds_feature.location.end
@@ -63,6 +74,50 @@ class RBSChooser:
                         }
         return gene_dict
     
+    @staticmethod
+    def load_genes_info(genbank_file):
+        """
+        Loads gene information for a given genbank file, reusing a pickled copy of the
+        extract_genes_info output when it is newer than the genbank file and was written
+        with the current GENE_CACHE_VERSION.
+
+        Parameters:
+            genbank_file: Path to the file containing sequence information.
+
+        Returns:
+            gene_dict (dict): Dictionary mapping locus ID to gene name, UTR, CDS and sequence.
+        """
+
+        cache_file = f"{genbank_file}.cache.pkl"
+        if os.path.exists(cache_file) and os.path.getmtime(genbank_file) <= os.path.getmtime(cache_file):
+            # A corrupt, truncated or outdated cache can fail to unpickle in many ways
+            # (UnicodeDecodeError, ValueError, MemoryError, ...), so any failure falls
+            # through to rebuilding it below
+            try:
+                with open(cache_file, 'rb') as file:
+                    cached = pickle.load(file)
+                if isinstance(cached, dict) and cached.get("version") == GENE_CACHE_VERSION \
+                        and isinstance(cached.get("genes"), dict):
+                    return cached["genes"]
+            except Exception:
+                pass
+
+        # Cache plain strings so the pickle does not depend on Biopython's Seq internals
+        gene_dict = {
+            locus_tag: {"gene": info["gene"], "UTR": str(info["UTR"]), "CDS": str(info["CDS"])}
+            for locus_tag, info in RBSChooser.extract_genes_info(genbank_file).items()
+        }
+
+        # Write to a temporary file first so an interrupted dump never leaves a truncated cache
+        try:
+            with open(f"{cache_file}.tmp", 'wb') as file:
+                pickle.dump({"version": GENE_CACHE_VERSION, "genes": gene_dict}, file, protocol=5)
+            os.replace(f"{cache_file}.tmp", cache_file)
+        except OSError:
+            pass
+
+        return gene_dict
+
     @staticmethod
     def prune_gene_info(proteomics_file):
         """
@@ -92,9 +147,8 @@ class RBSChooser:
 
                 proteomics_data[protein_id] = abundance
 
-        sorted_proteomics_data = dict(sorted(proteomics_data.items(), key=lambda item: item[1], reverse=True))
-        top_5_percent = max(1, int(0.05 * len(sorted_proteomics_data)))
-        pruned_data = dict(list(sorted_proteomics_data.items())[:top_5_percent])
+        top_5_percent = max(1, int(0.05 * len(proteomics_data)))
+        pruned_data = dict(heapq.nlargest(top_5_percent, proteomics_data.items(), key=lambda item: item[1]))
 
         return pruned_data
     
@@ -130,7 +184,7 @@ class RBSChooser:
         Initializes RBSChooser with RBS options. 
         """
 
-        self.gene_data = self.extract_genes_info('genedesign/data/sequence.gb')
+        self.gene_data = self.load_genes_info('genedesign/data/sequence.gb')
         self.pruned_data = self.prune_gene_info('genedesign/data/511145-WHOLE_ORGANISM-integrated.txt')
         self.merged_data = self.merge_data(self.pruned_data, self.gene_data)
 
@@ -139,10 +193,15 @@ class RBSChooser:
                 utr = gene_info.get('UTR')
                 cds = gene_info.get('CDS')
                 gene_name = gene_info.get('gene')
-                first_six_aas = self.translator.run(str(cds)[:18])
+                first_six_aas = self.translator.run(cds[:18])
 
                 rbs_option = RBSOption(utr, cds, gene_name, first_six_aas)
                 self.rbs_options.append(rbs_option)
+
+        # Map each option to its position(s) so ignores can be excluded without hashing every option
+        self.rbs_option_index = defaultdict(list)
+        for i, rbs_option in enumerate(self.rbs_options):
+            self.rbs_option_index[rbs_option].append(i)
         
     def run(self, cds: str, ignores: set) -> RBSOption:
         """
@@ -157,18 +216,33 @@ class RBSChooser:
         """
 
         filtered_rbs_options = exclude_ignored(self, ignores)
+        cds_peptide = self.translator.run(cds[:18])
+
+        # Score the cheap peptide distance first and visit options in order of increasing distance.
+        # Hairpin counts are nonnegative, so once an option's distance alone cannot beat the best
+        # (score, index) found so far, its hairpins are never counted.
+        distances = [compare_peptides(cds_peptide, option) for option in filtered_rbs_options]
+        order = sorted(range(len(filtered_rbs_options)), key=distances.__getitem__)
 
         best_option = None
         best_score = float('inf')
+        best_index = len(filtered_rbs_options)
+
+        for i in order:
+            distance = distances[i]
+            if distance > best_score:
+                break
+            if (distance, i) >= (best_score, best_index):
+                continue
 
-        for option in filtered_rbs_options:
-            hairpins = check_secondary_structure(self, option, cds)[0]
-            distance = compare_peptides(self, option, cds)
+            option = filtered_rbs_options[i]
+            hairpins = check_secondary_structure(self, option, cds)
             score = hairpins + distance
             
-            if score < best_score:
+            if (score, i) < (best_score, best_index):
                 best_option = option
                 best_score = score
+                best_index = i
 
         return best_option
 
@@ -1,6 +1,12 @@
+from functools import lru_cache
+
+@lru_cache(maxsize=65536)
 def calculate_edit_distance(s1, s2):
     """
-    Compute the edit distance between two strings using a dynamic programming approach based on the Smith-Waterman algorithm for local alignment.
+    Compute the edit distance between two strings using Myers' bit-parallel algorithm. Each DP column for s1 is packed
+    into the bits of an integer, so every character of s2 is processed with a handful of integer operations instead of
+    a row of DP cells.
+    Results are memoized, since RBS selection compares the same short peptides across runs.
 
     Parameters:
         s1 (str): The first string to compare.
@@ -10,24 +16,39 @@ def calculate_edit_distance(s1, s2):
         int: The edit distance between the two strings, defined as the minimum number of edits (insertions, deletions, or substitutions) required to transform one string into the other.
     """
     s1_len = len(s1)
-    s2_len = len(s2)
-    dist = [[0] * (s2_len + 1) for _ in range(s1_len + 1)]
-
-    # Initialize distances for transformations involving empty strings
-    for i in range(s1_len + 1):
-        dist[i][0] = i
-    for j in range(s2_len + 1):
-        dist[0][j] = j
-
-    # Compute distances
-    for i in range(1, s1_len + 1):
-        for j in range(1, s2_len + 1):
-            if s1[i - 1] == s2[j - 1]:
-                dist[i][j] = dist[i - 1][j - 1]
-            else:
-                dist[i][j] = 1 + min(dist[i - 1][j], dist[i][j - 1], dist[i - 1][j - 1])
-
-    return dist[s1_len][s2_len]
+    if s1_len == 0:
+        return len(s2)
+
+    # Bitmask of the positions in s1 where each character occurs
+    peq = {}
+    for i, char in enumerate(s1):
+        peq[char] = peq.get(char, 0) | (1 << i)
+
+    mask = (1 << s1_len) - 1
+    last_bit = 1 << (s1_len - 1)
+    pv = mask  # Vertical deltas of +1
+    mv = 0     # Vertical deltas of -1
+    dist = s1_len
+
+    for char in s2:
+        eq = peq.get(char, 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = mv | (~(xh | pv) & mask)
+        mh = pv & xh
+
+        # Track the distance in the last row of the DP matrix
+        if ph & last_bit:
+            dist += 1
+        elif mh & last_bit:
+            dist -= 1
+
+        ph = ((ph << 1) | 1) & mask
+        mh = (mh << 1) & mask
+        pv = mh | (~(xv | ph) & mask)
+        mv = ph & xv
+
+    return dist
 
 def main():
     # Example usage
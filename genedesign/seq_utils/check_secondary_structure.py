@@ -1,5 +1,19 @@
+from functools import lru_cache
 from seq_utils.hairpin_counter import hairpin_counter
 
+# Hairpins can only involve the UTR if their second stem lies within the first 15 nt of the CDS,
+# so scanning a 50 nt prefix leaves the difference in hairpin count between RBS options unchanged.
+_CDS_WINDOW = 50
+
+@lru_cache(maxsize=4096)
+def _count_hairpins(utr, cds_prefix):
+        """
+        Counts the hairpins in a UTR joined to a CDS prefix, memoized since the same
+        UTR/CDS pairs are scored repeatedly across RBSChooser runs.
+        """
+
+        return hairpin_counter(utr + cds_prefix)[0]
+
 def check_secondary_structure(self, rbs_option, cds):
         """
         Checks for the potential secondary structure formation in the combined RBS-CDS sequence.
@@ -9,8 +23,9 @@ def check_secondary_structure(self, rbs_option, cds):
             cds (str): The CDS sequence to check with the given RBSOption.
 
         Returns:
-            int: The number of secondary structures (hairpins) detected in the RBS + CDS.
+            int: The memoized number of hairpins in the UTR joined to only the first _CDS_WINDOW (50) nt
+                of the CDS. This is not the hairpin count of the full RBS + CDS, so it is only meaningful
+                when compared against other RBS options scored with the same CDS.
         """
 
-        combined_seq = rbs_option.utr + cds
-        return hairpin_counter(combined_seq)
\ No newline at end of file
+        return _count_hairpins(rbs_option.utr, cds[:_CDS_WINDOW])
\ No newline at end of file
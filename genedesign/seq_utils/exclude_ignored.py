@@ -2,6 +2,9 @@ def exclude_ignored(self, ignores):
         """
         Excludes RBSOptions that are in the ignores set.
 
+        Only the ignored options are hashed: each is looked up in the precomputed
+        option index, and the remaining options are kept in their original order.
+
         Parameters: 
             ignores (Set[[RBSOptions]): Set of RBSOptions to be ignored.
 
@@ -9,4 +12,11 @@ def exclude_ignored(self, ignores):
             List[RBSOption]: List of RBSOptions that are not in the ignores set.
         """     
 
-        return [option for option in self.rbs_options if option not in ignores]
\ No newline at end of file
+        if not ignores:
+            return list(self.rbs_options)
+
+        skipped = set()
+        for option in ignores:
+            skipped.update(self.rbs_option_index.get(option, ()))
+
+        return [option for i, option in enumerate(self.rbs_options) if i not in skipped]
\ No newline at end of file
@@ -0,0 +1,36 @@
+import pytest
+from genedesign.checkers.internal_rbs_checker import InternalRBSChecker
+
+@pytest.fixture
+def checker():
+    checker = InternalRBSChecker()
+    checker.initiate()
+    return checker
+
+def test_spacer_lengths(checker):
+    # Shine-Dalgarno sequence followed by a start codon 7, 8 and 9 bases downstream
+    for spacer in ["ACGGCAU", "ACGGCAUC", "ACGGCAUCG"]:
+        seq = "GG" + "AUUAUU" + spacer + "AUG" + "CC"
+        result, num_sites, positions = checker.run(seq)
+        assert result == False
+        assert num_sites == 1
+        assert positions == [2]
+
+def test_spacer_out_of_range(checker):
+    # Start codon too close to or too far from the Shine-Dalgarno sequence
+    for spacer in ["ACGGCA", "ACGGCAUCGA"]:
+        seq = "AUUAUU" + spacer + "AUG"
+        assert checker.run(seq) == (True, 0, [])
+
+def test_dna_input(checker):
+    # DNA input is converted to RNA before scanning
+    seq = "ATTATTACGGCATCATG"
+    assert checker.run(seq) == (False, 1, [0])
+
+def test_multiple_sites(checker):
+    seq = "AUUAUUACGGCAUAUGGGAUUAUUCCCCCCCAUG"
+    assert checker.run(seq) == (False, 2, [0, 18])
+
+def test_no_site(checker):
+    assert checker.run("") == (True, 0, [])
+    assert checker.run("AUGGCUAAGGAGGAUGCUAA") == (True, 0, [])
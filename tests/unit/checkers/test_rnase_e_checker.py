@@ -0,0 +1,103 @@
+import pytest
+from genedesign.checkers.rnase_e_checker import RNaseEChecker
+from genedesign.models.rbs_option import RBSOption
+from genedesign.models.transcript import Transcript
+from genedesign.models.operon import Operon
+
+@pytest.fixture(scope="module")
+def checker():
+    checker = RNaseEChecker()
+    checker.initiate()
+    return checker
+
+@pytest.fixture(scope="module")
+def sample_operon():
+    rbs1 = RBSOption(
+        utr="AGGGAUUAAGGAUAUUAU",
+        cds="AUGGCUAAGGAGGAUGCUAA",
+        gene_name="gene1",
+        first_six_aas="MAKGMC"
+    )
+    rbs2 = RBSOption(
+        utr="AUGGAUUAGGAUUUAA",
+        cds="AUGGUAUUUAAGGCUAGG",
+        gene_name="gene2",
+        first_six_aas="MGYAGG"
+    )
+    transcript1 = Transcript(rbs=rbs1, peptide="MAGMC", codons=["AUG", "GCU", "AAG", "GAG", "GCU"])
+    transcript2 = Transcript(rbs=rbs2, peptide="MGYAG", codons=["AUG", "GUA", "UUU", "AAG", "GCU"])
+    return Operon(transcripts=[transcript1, transcript2], promoter="GGACA", terminator="UGA")
+
+@pytest.fixture(scope="module")
+def operon_seq(sample_operon):
+    return sample_operon.promoter + sample_operon.assembled + sample_operon.terminator
+
+@pytest.fixture(scope="module")
+def operon_scan(checker, operon_seq):
+    # Scan the sample operon once and share the result across tests
+    return checker.run(operon_seq)
+
+def test_rnase_e_site_present(checker):
+    for site in ["AAUUA", "AAUUU", "UAUUA", "UAUUU"]:
+        result, num_sites, positions = checker.run("GGC" + site + "GGC")
+        assert result == False
+        assert num_sites == 1
+        assert positions == [3]
+
+def test_multiple_rnase_e_sites(checker):
+    # Overlapping sites are reported individually
+    result, num_sites, positions = checker.run("GGUAUUAUUAGGCAAUUUG")
+    assert result == False
+    assert num_sites == 3
+    assert positions == [2, 5, 13]
+
+def test_dna_input(checker):
+    # DNA input is converted to RNA before scanning
+    assert checker.run("GGTATTAGG") == (False, 1, [2])
+
+def test_bytes_input(checker):
+    assert checker.run(b"GGTATTAGG") == (False, 1, [2])
+    assert checker.passes(b"GGTATTAGG") == False
+    assert checker.passes(b"GGCGAUUCGCCG") == True
+
+def test_no_rnase_e_site(checker):
+    assert checker.run("GGCGAUUCGCCGAUUGAGAUUA") == (True, 0, [])
+
+def test_empty_sequence(checker):
+    assert checker.run("") == (True, 0, [])
+
+def test_boundary_case_no_match(checker):
+    # Sequences shorter than the motif, or truncated at either end
+    assert checker.run("AAUU") == (True, 0, [])
+    assert checker.run("AUUA") == (True, 0, [])
+    assert checker.run("GAUUA") == (True, 0, [])
+
+def test_sample_operon_sequence(operon_scan):
+    result, num_sites, positions = operon_scan
+    assert result == False
+    assert num_sites == len(positions) == 2
+
+def test_sample_operon_site_positions(operon_seq, operon_scan):
+    for pos in operon_scan[2]:
+        assert operon_seq[pos] in "AU"
+        assert operon_seq[pos + 1:pos + 4] == "AUU"
+        assert operon_seq[pos + 4] in "AU"
+
+def test_passes_matches_run(checker, operon_seq, operon_scan):
+    for seq in ["", "AAUU", "GGCGAUUCGCCG", "GGTATTAGG", "GGUAUUAUUAGGCAAUUUG"]:
+        assert checker.passes(seq) == checker.run(seq)[0]
+    assert checker.passes(operon_seq) == operon_scan[0]
+
+def test_run_many_matches_run(checker, operon_seq):
+    seqs = ["", "AAUU", "GGCGAUUCGCCG", "GGTATTAGG", b"GGUAUUAUUAGGCAAUUUG", operon_seq]
+    assert checker.run_many(seqs) == [checker.run(seq) for seq in seqs]
+    assert checker.run_many([]) == []
+
+@pytest.mark.parametrize("length", [255, 256])
+def test_short_and_long_scans_agree(checker, length):
+    # 255 bases is scanned with bytes.find and 256 with the NumPy masks; both must report the same sites
+    # A site at index 0, then three overlapping sites with the last one ending on the final base
+    seq = "AAUUU" + "G" * (length - 16) + "UAUUAUUAUUA"
+    assert len(seq) == length
+    assert checker.run(seq) == (False, 4, [0, length - 11, length - 8, length - 5])
+    assert checker.passes(seq) == False
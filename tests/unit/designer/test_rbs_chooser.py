@@ -0,0 +1,74 @@
+import pickle
+import pytest
+from genedesign.rbs_chooser import RBSChooser, GENE_CACHE_VERSION
+from genedesign.models.rbs_option import RBSOption
+from genedesign.seq_utils.exclude_ignored import exclude_ignored
+
+GENES = {"b0001": {"gene": "thrL", "UTR": "AAGGAGG", "CDS": "ATGAAACGCTAA"}}
+
+@pytest.fixture
+def genbank_file(tmp_path, monkeypatch):
+    """
+    A placeholder genbank file whose parsing is replaced by a stub that counts its calls.
+    """
+    path = tmp_path / "sequence.gb"
+    path.write_text("placeholder")
+    calls = []
+
+    def fake_extract(genbank_file):
+        calls.append(genbank_file)
+        return GENES
+
+    monkeypatch.setattr(RBSChooser, "extract_genes_info", staticmethod(fake_extract))
+    return path, calls
+
+def test_cache_is_reused(genbank_file):
+    path, calls = genbank_file
+    assert RBSChooser.load_genes_info(str(path)) == GENES
+    assert RBSChooser.load_genes_info(str(path)) == GENES
+    assert len(calls) == 1
+
+def bit_flipped_payload():
+    """
+    A real cache payload with the high bit of one string byte flipped, which breaks its UTF-8 decoding.
+    """
+    payload = bytearray(pickle.dumps({"version": GENE_CACHE_VERSION, "genes": GENES}, protocol=5))
+    payload[payload.index(b"thrL") + 3] ^= 0x80
+    return bytes(payload)
+
+@pytest.mark.parametrize("contents", [
+    b"",
+    b"not a pickle",
+    b"I1x\n.",
+    bit_flipped_payload(),
+    pickle.dumps({"version": GENE_CACHE_VERSION}),
+    pickle.dumps({"version": GENE_CACHE_VERSION - 1, "genes": {}}),
+])
+def test_bad_cache_is_rebuilt(genbank_file, contents):
+    path, calls = genbank_file
+    cache_file = path.parent / (path.name + ".cache.pkl")
+    cache_file.write_bytes(contents)
+
+    assert RBSChooser.load_genes_info(str(path)) == GENES
+    assert len(calls) == 1
+
+    # The rebuilt cache is valid and used on the next load
+    assert RBSChooser.load_genes_info(str(path)) == GENES
+    assert len(calls) == 1
+
+def test_exclude_ignored_before_initiate():
+    chooser = RBSChooser()
+    ignored = RBSOption("AAGGAGG", "ATGAAACGCTAA", "thrL", "MKR")
+    assert exclude_ignored(chooser, {ignored}) == []
+
+def test_exclude_ignored_returns_new_list():
+    chooser = RBSChooser()
+    kept = RBSOption("AAGGAGG", "ATGAAACGCTAA", "thrL", "MKR")
+    ignored = RBSOption("AGGAGGU", "ATGGCTTAA", "lacZ", "MA")
+    chooser.rbs_options = [kept, ignored]
+    chooser.rbs_option_index = {kept: [0], ignored: [1]}
+
+    filtered = exclude_ignored(chooser, set())
+    assert filtered == [kept, ignored]
+    assert filtered is not chooser.rbs_options
+    assert exclude_ignored(chooser, {ignored}) == [kept]
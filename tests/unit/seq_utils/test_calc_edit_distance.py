@@ -0,0 +1,25 @@
+import pytest
+from genedesign.seq_utils.calc_edit_distance import calculate_edit_distance
+
+@pytest.mark.parametrize("s1, s2, expected", [
+    ("", "", 0),
+    ("", "MKV", 3),
+    ("MKV", "", 3),
+    ("MAKGMC", "MAKGMC", 0),
+    ("MAKGMC", "MAKGMV", 1),   # Substitution
+    ("MAKGMC", "MAKMC", 1),    # Deletion
+    ("MAKGMC", "MAKGGMC", 1),  # Insertion
+    ("MYPFIR", "MKKLLP", 5),
+    ("AACAAGATAT", "AACATGATAT", 1),
+    ("AACAAGTTAT", "ATCAAGTTCT", 2),
+])
+def test_edit_distance(s1, s2, expected):
+    assert calculate_edit_distance(s1, s2) == expected
+    assert calculate_edit_distance(s2, s1) == expected
+
+def test_long_sequences():
+    # Longer than a 64-bit word
+    s1 = "ACGT" * 20
+    s2 = "ACGT" * 19 + "ACGA"
+    assert calculate_edit_distance(s1, s2) == 1
+    assert calculate_edit_distance(s1, s1[1:]) == 1